@@ -5,55 +5,95 @@ WayKeyLight - System tray application for controlling Elgato Key Lights on Wayla
 
 import os
 import sys
-import json
+import asyncio
 import threading
+import time
 
 # Suppress Qt style warnings
 os.environ.pop('QT_STYLE_OVERRIDE', None)
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import requests
-from zeroconf import ServiceBrowser, Zeroconf, ServiceInfo
+from requests.adapters import HTTPAdapter
+from zeroconf import Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 from PyQt6.QtWidgets import (
     QApplication, QSystemTrayIcon, QMenu, QWidget, QPushButton,
     QSlider, QLabel, QHBoxLayout, QVBoxLayout, QCheckBox, QFrame,
-    QGraphicsDropShadowEffect
+    QGraphicsDropShadowEffect, QStyle, QStyleOptionSlider
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPoint, QRect, QThread, pyqtSlot, QEvent
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QPoint, QRect, pyqtSlot, QEvent
 from PyQt6.QtGui import QIcon, QAction, QCursor, QScreen, QPalette, QColor, QMouseEvent
 
 
-class APIWorker(QThread):
-    """Worker thread for API calls to avoid blocking UI"""
+class APIWorker(QObject):
+    """Runs API calls on a shared thread pool to avoid blocking UI"""
     result_ready = pyqtSignal(str, bool, int)  # serial, is_on, brightness
+    statuses_ready = pyqtSignal(list)  # [(serial, is_on, brightness), ...]
+    brightness_done = pyqtSignal(str, int)  # serial, generation of the finished request
     
-    def __init__(self, light, operation, value=None):
+    def __init__(self, max_workers: int = 4):
         super().__init__()
-        self.light = light
-        self.operation = operation
-        self.value = value
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+    def submit(self, light, operation, value=None) -> Future:
+        """Queue an API call, result_ready is emitted once it succeeds"""
+        return self.executor.submit(self._run, light, operation, value)
+        
+    def set_brightness(self, light, value: int, generation: int):
+        """Queue a brightness change, brightness_done is emitted when it finishes either way"""
+        future = self.submit(light, 'brightness', value)
+        future.add_done_callback(
+            lambda _: self.brightness_done.emit(light.serial_number, generation))
+        
+    def poll(self, lights: List["KeyLight"]):
+        """Fetch status of all lights in parallel, statuses_ready is emitted once for the batch"""
+        lock = threading.Lock()
+        remaining = len(lights)
+        
+        def on_done(_):
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining:
+                    return
+            self.statuses_ready.emit([
+                (light.serial_number, light.is_on, light.brightness) for light in lights
+            ])
+        
+        for light in lights:
+            self.executor.submit(self._get_status, light).add_done_callback(on_done)
+            
+    def _get_status(self, light):
+        """Refresh a single light's status in pool thread"""
+        try:
+            light.get_status()
+        except Exception as e:
+            print(f"API Worker error: {e}")
         
-    def run(self):
-        """Execute API call in thread"""
+    def _run(self, light, operation, value):
+        """Execute API call in pool thread"""
         try:
-            if self.operation == 'toggle':
-                success = self.light.toggle()
+            if operation == 'toggle':
+                success = light.toggle()
                 if success:
-                    self.result_ready.emit(self.light.serial_number, self.light.is_on, self.light.brightness)
-            elif self.operation == 'brightness':
-                success = self.light.set_state(brightness=self.value)
+                    self.result_ready.emit(light.serial_number, light.is_on, light.brightness)
+            elif operation == 'brightness':
+                success = light.set_state(brightness=value)
                 if success:
-                    self.result_ready.emit(self.light.serial_number, self.light.is_on, self.light.brightness)
-            elif self.operation == 'power':
-                success = self.light.set_state(on=self.value)
+                    self.result_ready.emit(light.serial_number, light.is_on, light.brightness)
+            elif operation == 'power':
+                success = light.set_state(on=value)
                 if success:
-                    self.result_ready.emit(self.light.serial_number, self.light.is_on, self.light.brightness)
-            elif self.operation == 'status':
-                self.light.get_status()
-                self.result_ready.emit(self.light.serial_number, self.light.is_on, self.light.brightness)
+                    self.result_ready.emit(light.serial_number, light.is_on, light.brightness)
         except Exception as e:
             print(f"API Worker error: {e}")
+            
+    def shutdown(self):
+        """Stop accepting new API calls"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 
 @dataclass
@@ -66,88 +106,139 @@ class KeyLight:
     is_on: bool = False
     brightness: int = 50
     temperature: int = 4500
+    friendly_name: Optional[str] = None  # displayName reported by the device
+    base_url: str = field(init=False, repr=False, compare=False)
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+    
+    # Seconds a fetched status is reused before hitting the device again
+    STATUS_CACHE_TTL = 0.5
     
-    @property
-    def base_url(self) -> str:
-        return f"http://{self.ip}:{self.port}/elgato"
+    def __post_init__(self):
+        self.base_url = f"http://{self.ip}:{self.port}/elgato"
+        
+        # Keep one connection open per light so polls and slider updates
+        # reuse the socket instead of doing a new TCP handshake every call
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self._session.mount("http://", adapter)
+        
+        # Requests to a light run one at a time over that single connection,
+        # whichever pool thread they are issued from
+        self._lock = threading.RLock()
+        
+        # Short-lived status cache shared by the poll timer and UI refreshes
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_ts = 0.0
+        
+        # Request body for set_state, updated in place on every call
+        self._state_template = {"lights": [{"on": 0, "brightness": 50, "temperature": 4500}]}
     
     def get_status(self) -> Optional[Dict[str, Any]]:
-        """Get current light status"""
-        try:
-            response = requests.get(f"{self.base_url}/lights", timeout=1)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("lights") and len(data["lights"]) > 0:
-                    light = data["lights"][0]
-                    self.is_on = light.get("on", 0) == 1
-                    self.brightness = light.get("brightness", 50)
-                    self.temperature = light.get("temperature", 4500)
-                    return light
-        except Exception as e:
-            print(f"Error getting status for {self.name}: {e}")
-        return None
+        """Get current light status, reusing a response fetched within the cache TTL"""
+        with self._lock:
+            if (self._status_cache is not None and
+                    time.monotonic() - self._status_cache_ts < self.STATUS_CACHE_TTL):
+                return self._status_cache
+            
+            try:
+                response = self._session.get(self.base_url + "/lights", timeout=1)
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    if data.get("lights") and len(data["lights"]) > 0:
+                        light = data["lights"][0]
+                        self.is_on = light.get("on", 0) == 1
+                        self.brightness = light.get("brightness", 50)
+                        self.temperature = light.get("temperature", 4500)
+                        self._status_cache = light
+                        self._status_cache_ts = time.monotonic()
+                        return light
+            except Exception as e:
+                print(f"Error getting status for {self.name}: {e}")
+            return None
     
     def get_friendly_name(self) -> str:
         """Get the user-configured friendly name from settings"""
-        try:
-            # Try settings endpoint first
-            response = requests.get(f"{self.base_url}/settings", timeout=1)
-            if response.status_code == 200:
-                settings = response.json()
-                if "displayName" in settings and settings["displayName"]:
-                    return settings["displayName"]
-        except:
-            pass
+        with self._lock:
+            # The display name only changes through the Elgato app, so once the
+            # device has reported one we keep it for the lifetime of the light
+            if self.friendly_name:
+                return self.friendly_name
         
-        try:
-            # Try accessory-info endpoint
-            response = requests.get(f"{self.base_url}/accessory-info", timeout=1)
-            if response.status_code == 200:
-                info = response.json()
-                if "displayName" in info and info["displayName"]:
-                    return info["displayName"]
-        except:
-            pass
-        
-        # Fallback to original name with IP for differentiation
-        return f"{self.name} ({self.ip.split('.')[-1]})"
+            try:
+                # Try settings endpoint first
+                response = self._session.get(self.base_url + "/settings", timeout=1)
+                if response.status_code == 200:
+                    settings = orjson.loads(response.content)
+                    if "displayName" in settings and settings["displayName"]:
+                        self.friendly_name = settings["displayName"]
+                        return self.friendly_name
+            except:
+                pass
+        
+            try:
+                # Try accessory-info endpoint
+                response = self._session.get(self.base_url + "/accessory-info", timeout=1)
+                if response.status_code == 200:
+                    info = orjson.loads(response.content)
+                    if "displayName" in info and info["displayName"]:
+                        self.friendly_name = info["displayName"]
+                        return self.friendly_name
+            except:
+                pass
+        
+            # Fallback to original name with IP for differentiation
+            return f"{self.name} ({self.ip.split('.')[-1]})"
     
     def set_state(self, on: Optional[bool] = None, brightness: Optional[int] = None, 
                   temperature: Optional[int] = None) -> bool:
         """Set light state"""
-        try:
-            # Prepare update data
-            update_data = {
-                "lights": [{
-                    "on": 1 if (on if on is not None else self.is_on) else 0,
-                    "brightness": brightness if brightness is not None else self.brightness,
-                    "temperature": temperature if temperature is not None else self.temperature
-                }]
-            }
+        with self._lock:
+            # Drop the cached status so the next poll sees the new state
+            self._status_cache_ts = 0.0
+            try:
+                # Fill in the reusable request body, safe under the lock
+                state = self._state_template["lights"][0]
+                state["on"] = 1 if (on if on is not None else self.is_on) else 0
+                state["brightness"] = brightness if brightness is not None else self.brightness
+                state["temperature"] = temperature if temperature is not None else self.temperature
             
-            response = requests.put(
-                f"{self.base_url}/lights",
-                json=update_data,
-                headers={"Content-Type": "application/json"},
-                timeout=1
-            )
+                response = self._session.put(
+                    self.base_url + "/lights",
+                    data=orjson.dumps(self._state_template),
+                    headers={"Content-Type": "application/json"},
+                    timeout=1
+                )
             
-            if response.status_code == 200:
-                # Update local state
-                if on is not None:
-                    self.is_on = on
-                if brightness is not None:
-                    self.brightness = brightness
-                if temperature is not None:
-                    self.temperature = temperature
-                return True
-        except Exception as e:
-            print(f"Error setting state for {self.name}: {e}")
-        return False
+                if response.status_code == 200:
+                    # Update local state
+                    if on is not None:
+                        self.is_on = on
+                    if brightness is not None:
+                        self.brightness = brightness
+                    if temperature is not None:
+                        self.temperature = temperature
+                    return True
+            except Exception as e:
+                print(f"Error setting state for {self.name}: {e}")
+            return False
     
     def toggle(self) -> bool:
         """Toggle light on/off"""
-        return self.set_state(on=not self.is_on)
+        with self._lock:
+            return self.set_state(on=not self.is_on)
+    
+    def update_address(self, ip: str, port: int):
+        """Point the light at a new address announced over mDNS"""
+        # Called on the zeroconf event loop, so don't wait on a request in
+        # flight; requests read base_url once and the swap is atomic
+        self.ip = ip
+        self.port = port
+        self.base_url = f"http://{ip}:{port}/elgato"
+        self._status_cache_ts = 0.0
+    
+    def close(self):
+        """Close the HTTP session and its pooled connection"""
+        self._session.close()
 
 
 class KeyLightDiscovery(QObject):
@@ -158,37 +249,98 @@ class KeyLightDiscovery(QObject):
     
     def __init__(self):
         super().__init__()
-        self.zeroconf = None
+        self.aiozc: Optional[AsyncZeroconf] = None
         self.browser = None
         self.lights: Dict[str, KeyLight] = {}
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # Friendly names by serial, kept across removal so a light that
+        # drops off and comes back doesn't need its name probed again
+        self.friendly_names: Dict[str, str] = {}
+        # Everything runs on zeroconf's own event loop except the blocking
+        # HTTP probes of new lights, which go to the loop's default executor
+        self._tasks = set()
+        self._probing = set()  # serials being probed, only touched on the loop
+        self._zeroconf_lock = threading.Lock()
+        self._start_generation = 0
         
     def start(self):
-        """Start discovery service"""
-        self.zeroconf = Zeroconf()
-        self.browser = ServiceBrowser(
-            self.zeroconf,
-            "_elg._tcp.local.",
-            self
-        )
+        """Start discovery service without blocking the Qt event loop"""
+        with self._zeroconf_lock:
+            generation = self._start_generation
+        threading.Thread(target=self._start_async, args=(generation,), daemon=True).start()
+    
+    def _start_async(self, generation: int):
+        """Create the Zeroconf instance and browser in a bootstrap thread"""
+        # Build outside the lock so stop() on the Qt thread never waits on it
+        try:
+            aiozc = AsyncZeroconf()
+        except Exception as e:
+            print(f"Error starting Key Light discovery: {e}")
+            return
+        
+        with self._zeroconf_lock:
+            stale = generation != self._start_generation
+            if not stale:
+                # A previous start may not have been stopped yet, don't leak it
+                self._close_zeroconf()
+                # Publish zeroconf before the browser so early callbacks see it
+                self.aiozc = aiozc
+        if stale:
+            # stop() ran after this start was queued
+            aiozc.zeroconf.close()
+            return
+        
+        try:
+            # The browser must be created on zeroconf's event loop thread
+            browser = asyncio.run_coroutine_threadsafe(
+                self._async_create_browser(aiozc), aiozc.zeroconf.loop
+            ).result(timeout=5)
+        except Exception as e:
+            print(f"Error starting Key Light discovery: {e}")
+            return
+        
+        with self._zeroconf_lock:
+            if self.aiozc is aiozc:
+                self.browser = browser
         print("Started Key Light discovery service")
     
+    async def _async_create_browser(self, aiozc: AsyncZeroconf) -> AsyncServiceBrowser:
+        return AsyncServiceBrowser(aiozc.zeroconf, "_elg._tcp.local.", listener=self)
+    
     def stop(self):
         """Stop discovery service"""
-        if self.zeroconf:
-            self.zeroconf.close()
-            self.zeroconf = None
-            self.browser = None
-        self.executor.shutdown(wait=False)
+        with self._zeroconf_lock:
+            # Invalidate starts that are still queued
+            self._start_generation += 1
+            self._close_zeroconf()
         print("Stopped Key Light discovery service")
     
+    def shutdown(self):
+        """Stop discovery for good and close the lights' HTTP sessions"""
+        self.stop()
+        # Snapshot, a probe thread may still be adding lights
+        for light in list(self.lights.values()):
+            light.close()
+    
+    def _close_zeroconf(self):
+        """Close the current Zeroconf instance, caller holds _zeroconf_lock"""
+        if self.aiozc:
+            self.aiozc.zeroconf.close()
+            self.aiozc = None
+            self.browser = None
+    
     def add_service(self, zeroconf: Zeroconf, type_: str, name: str) -> None:
-        """Called when a new service is discovered"""
-        self.executor.submit(self._process_service_async, zeroconf, type_, name)
+        """Called on the zeroconf event loop when a new service is discovered"""
+        self._schedule(self._async_process_service(zeroconf, type_, name))
     
     def update_service(self, zeroconf: Zeroconf, type_: str, name: str) -> None:
-        """Called when a service is updated"""
-        self.executor.submit(self._process_service_async, zeroconf, type_, name)
+        """Called on the zeroconf event loop when a service is updated"""
+        self._schedule(self._async_process_service(zeroconf, type_, name))
+    
+    def _schedule(self, coro):
+        """Run a coroutine on the current loop, keeping it referenced until done"""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
     
     def remove_service(self, zeroconf: Zeroconf, type_: str, name: str) -> None:
         """Called when a service is removed"""
@@ -197,56 +349,91 @@ class KeyLightDiscovery(QObject):
         if len(parts) >= 4:
             serial = parts[3].split(".")[0]
             if serial in self.lights:
-                del self.lights[serial]
+                self.lights.pop(serial).close()
                 self.light_removed.emit(serial)
                 print(f"Key Light removed: {serial}")
     
-    def _process_service_async(self, zeroconf: Zeroconf, type_: str, name: str):
-        """Process service info in thread pool"""
-        info = zeroconf.get_service_info(type_, name)
-        if info:
-            self._process_service(info)
-    
-    def _process_service(self, info: ServiceInfo) -> None:
-        """Process discovered service info"""
-        if info.addresses:
-            ip = ".".join(map(str, info.addresses[0]))
-            port = info.port
-            
-            # Extract properties
-            properties = info.properties
-            serial = properties.get(b'id', b'').decode('utf-8')
-            display_name = properties.get(b'md', b'Elgato Key Light').decode('utf-8')
-            
-            if serial and serial not in self.lights:
-                light = KeyLight(
-                    name=display_name,
-                    ip=ip,
-                    port=port,
-                    serial_number=serial
-                )
-                
-                # Get initial status
-                light.get_status()
-                
-                # Get friendly name from device
-                friendly_name = light.get_friendly_name()
-                light.name = friendly_name
-                
-                self.lights[serial] = light
-                self.light_discovered.emit(light)
-                print(f"Discovered Key Light: {friendly_name} at {ip}:{port}")
+    async def _async_process_service(self, zeroconf: Zeroconf, type_: str, name: str):
+        """Resolve service info and handle known lights on the event loop"""
+        if self.aiozc is None or zeroconf is not self.aiozc.zeroconf:
+            # Callback from an instance that was stopped by a refresh
+            return
+        # Lights on the LAN answer within milliseconds, don't wait the default 3s
+        info = AsyncServiceInfo(type_, name)
+        if not await info.async_request(zeroconf, 500) or not info.addresses:
+            return
+        
+        ip = ".".join(map(str, info.addresses[0]))
+        port = info.port
+        
+        # Extract serial first, it's all that's needed for known lights
+        properties = info.properties
+        serial = properties.get(b'id', b'').decode('utf-8')
+        if not serial or serial in self._probing:
+            return
+        
+        known = self.lights.get(serial)
+        if known:
+            # Periodic re-announcement of a light we already have; only
+            # follow an address change, status and name are unchanged
+            if known.ip != ip or known.port != port:
+                known.update_address(ip, port)
+                print(f"Key Light {known.name} moved to {ip}:{port}")
+            return
+        
+        display_name = properties.get(b'md', b'Elgato Key Light').decode('utf-8')
+        self._probing.add(serial)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._process_service, serial, display_name, ip, port
+            )
+        finally:
+            self._probing.discard(serial)
+    
+    def _process_service(self, serial: str, display_name: str, ip: str, port: int) -> None:
+        """Probe a newly discovered light over HTTP in executor thread"""
+        light = KeyLight(
+            name=display_name,
+            ip=ip,
+            port=port,
+            serial_number=serial,
+            friendly_name=self.friendly_names.get(serial)
+        )
+        
+        # Get initial status
+        light.get_status()
+        
+        # Get friendly name from device, skipped if already known
+        friendly_name = light.get_friendly_name()
+        light.name = friendly_name
+        if light.friendly_name:
+            self.friendly_names[serial] = light.friendly_name
+        
+        self.lights[serial] = light
+        self.light_discovered.emit(light)
+        print(f"Discovered Key Light: {friendly_name} at {ip}:{port}")
 
 
 class LightControlWidget(QWidget):
     """Widget for controlling a single light"""
     
-    def __init__(self, light: KeyLight, parent=None):
+    # Delay after the last slider move before the brightness is sent
+    BRIGHTNESS_DEBOUNCE_MS = 500
+    
+    def __init__(self, light: KeyLight, api: APIWorker, parent=None):
         super().__init__(parent)
         self.light = light
-        self.api_worker = None
-        self.brightness_timer = None
+        self.api = api
         self.pending_brightness = None
+        
+        # Only one brightness PUT is in flight at a time; slider moves made
+        # meanwhile bump the generation and are sent once it completes
+        self.brightness_generation = 0
+        self.brightness_inflight = False
+        
+        # (is_on, brightness) currently shown, None when the user has changed
+        # the controls since and the next update must redraw
+        self.last_rendered = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -294,6 +481,11 @@ class LightControlWidget(QWidget):
         self.brightness_slider.installEventFilter(self)
         brightness_layout.addWidget(self.brightness_slider)
         
+        # Single debounce timer, restarted on every slider move
+        self.brightness_timer = QTimer(self)
+        self.brightness_timer.setSingleShot(True)
+        self.brightness_timer.timeout.connect(self.apply_pending_brightness)
+        
         self.brightness_value = QLabel(f"{self.light.brightness}%")
         self.brightness_value.setFixedWidth(35)
         self.brightness_value.setAlignment(Qt.AlignmentFlag.AlignRight)
@@ -306,34 +498,37 @@ class LightControlWidget(QWidget):
     def on_power_changed(self, state):
         """Handle power checkbox change"""
         is_on = state == Qt.CheckState.Checked.value
-        # Run in thread
-        self.api_worker = APIWorker(self.light, 'power', is_on)
-        self.api_worker.result_ready.connect(self.on_api_result)
-        self.api_worker.start()
+        self.last_rendered = None
+        self.api.submit(self.light, 'power', is_on)
         
     def on_brightness_changed(self, value):
         """Handle brightness slider change with heavy throttling"""
         self.brightness_value.setText(f"{value}%")
         self.pending_brightness = value
+        self.brightness_generation += 1
+        self.last_rendered = None
         
-        # Cancel previous timer if it exists
-        if self.brightness_timer:
-            self.brightness_timer.stop()
-            self.brightness_timer = None
-            
-        # Create new timer with longer delay for dragging
-        self.brightness_timer = QTimer()
-        self.brightness_timer.setSingleShot(True)
-        self.brightness_timer.timeout.connect(self.apply_pending_brightness)
-        self.brightness_timer.start(500)  # 500ms delay
+        # Restart the debounce timer, Qt reuses the running timer
+        self.brightness_timer.start(self.BRIGHTNESS_DEBOUNCE_MS)
         
     def apply_pending_brightness(self):
         """Apply the pending brightness change"""
-        if self.pending_brightness is not None:
-            self.api_worker = APIWorker(self.light, 'brightness', self.pending_brightness)
-            self.api_worker.result_ready.connect(self.on_api_result)
-            self.api_worker.start()
-            self.pending_brightness = None
+        if self.pending_brightness is None or self.brightness_inflight:
+            # The in-flight request dispatches the latest value when it finishes
+            return
+        
+        self.api.set_brightness(self.light, self.pending_brightness, self.brightness_generation)
+        self.pending_brightness = None
+        self.brightness_inflight = True
+        
+    def on_brightness_applied(self, generation):
+        """Send the latest slider value if it changed while a request was in flight"""
+        self.brightness_inflight = False
+        if generation < self.brightness_generation:
+            if not self.brightness_timer.isActive():
+                self.apply_pending_brightness()
+        else:
+            self.update_state()
             
     @pyqtSlot(str, bool, int)
     def on_api_result(self, serial, is_on, brightness):
@@ -345,15 +540,28 @@ class LightControlWidget(QWidget):
         
     def update_state(self):
         """Update widget to reflect current light state"""
+        state = (self.light.is_on, self.light.brightness)
+        if state == self.last_rendered:
+            return
+        
         self.power_checkbox.blockSignals(True)
         self.power_checkbox.setChecked(self.light.is_on)
         self.power_checkbox.blockSignals(False)
         
-        if self.pending_brightness is None:  # Only update if not currently dragging
+        # Only update if not currently dragging or waiting on a brightness change
+        if self.pending_brightness is None and not self.brightness_inflight:
             self.brightness_slider.blockSignals(True)
             self.brightness_slider.setValue(self.light.brightness)
             self.brightness_value.setText(f"{self.light.brightness}%")
             self.brightness_slider.blockSignals(False)
+            self.last_rendered = state
+        else:
+            self.last_rendered = None
+        
+    def shutdown(self):
+        """Drop any debounced brightness change that hasn't been sent yet"""
+        self.brightness_timer.stop()
+        self.pending_brightness = None
         
     def update_name(self, name: str):
         """Update the light name label"""
@@ -363,24 +571,25 @@ class LightControlWidget(QWidget):
         """Event filter to handle click-to-position on slider"""
         if source == self.brightness_slider and event.type() == QEvent.Type.MouseButtonPress:
             if isinstance(event, QMouseEvent):
-                # Calculate position as percentage
-                click_x = event.position().x()
-                slider_width = self.brightness_slider.width()
+                # Let the style map the click onto the groove, so handle size,
+                # groove offsets and direction match whatever theme is active
+                slider = self.brightness_slider
+                opt = QStyleOptionSlider()
+                slider.initStyleOption(opt)
+                style = slider.style()
+                groove = style.subControlRect(
+                    QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderGroove, slider)
+                handle = style.subControlRect(
+                    QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderHandle, slider)
                 
-                # Calculate the value based on click position
-                if slider_width > 0:
-                    # Account for slider handle width (roughly 12px)
-                    effective_width = slider_width - 12
-                    adjusted_x = max(0, min(click_x - 6, effective_width))
-                    
-                    # Calculate percentage and map to slider range
-                    percentage = adjusted_x / effective_width
-                    min_val = self.brightness_slider.minimum()
-                    max_val = self.brightness_slider.maximum()
-                    new_value = int(min_val + (max_val - min_val) * percentage)
+                span = groove.width() - handle.width()
+                if span > 0:
+                    click_x = int(event.position().x()) - groove.x() - handle.width() // 2
+                    new_value = QStyle.sliderValueFromPosition(
+                        slider.minimum(), slider.maximum(), click_x, span, opt.upsideDown)
                     
                     # Set the value directly
-                    self.brightness_slider.setValue(new_value)
+                    slider.setValue(new_value)
                     return True  # Event handled
                     
         return super().eventFilter(source, event)
@@ -389,9 +598,106 @@ class LightControlWidget(QWidget):
 class ControlPopup(QWidget):
     """Popup window for light controls"""
     
-    def __init__(self, parent=None):
+    popup_shown = pyqtSignal()
+    popup_hidden = pyqtSignal()
+    refresh_requested = pyqtSignal()
+    
+    # Dark theme styling, defined once for the class
+    _STYLESHEET = """
+        #container {
+            background-color: #1e1e1e;
+            border: 1px solid #3c3c3c;
+            border-radius: 8px;
+        }
+        
+        #title {
+            color: #e0e0e0;
+            font-weight: bold;
+            font-size: 12px;
+            padding: 2px;
+        }
+        
+        #separator {
+            background-color: #3c3c3c;
+            max-height: 1px;
+        }
+        
+        QLabel {
+            color: #e0e0e0;
+        }
+        
+        #no_lights {
+            color: #808080;
+            padding: 15px;
+        }
+        
+        QCheckBox {
+            color: #e0e0e0;
+            spacing: 5px;
+        }
+        
+        QCheckBox::indicator {
+            width: 16px;
+            height: 16px;
+            border: 1px solid #606060;
+            border-radius: 3px;
+            background-color: #2d2d2d;
+        }
+        
+        QCheckBox::indicator:checked {
+            background-color: #0d7377;
+            border-color: #14b8a6;
+        }
+        
+        QSlider::groove:horizontal {
+            height: 4px;
+            background: #3c3c3c;
+            border-radius: 2px;
+        }
+        
+        QSlider::handle:horizontal {
+            width: 12px;
+            height: 12px;
+            background: #14b8a6;
+            border-radius: 6px;
+            margin: -4px 0;
+        }
+        
+        QSlider::sub-page:horizontal {
+            background: #0d7377;
+            border-radius: 2px;
+        }
+        
+        QPushButton {
+            background-color: #2d2d2d;
+            color: #e0e0e0;
+            border: 1px solid #3c3c3c;
+            border-radius: 4px;
+            padding: 2px;
+            font-weight: bold;
+        }
+        
+        QPushButton:hover {
+            background-color: #3c3c3c;
+            border-color: #4c4c4c;
+        }
+        
+        QPushButton:pressed {
+            background-color: #252525;
+        }
+        
+        #refresh_btn, #close_btn {
+            font-size: 14px;
+        }
+    """
+    
+    def __init__(self, api: APIWorker, parent=None):
         super().__init__(parent)
+        self.api = api
         self.light_widgets: Dict[str, LightControlWidget] = {}
+        # Route API results by serial instead of broadcasting to every widget
+        self.api.result_ready.connect(self.on_api_result)
+        self.api.brightness_done.connect(self.on_brightness_done)
         self.setup_ui()
         
         # Set window title for identification
@@ -448,7 +754,7 @@ class ControlPopup(QWidget):
         refresh_button.setObjectName("refresh_btn")
         refresh_button.setFixedSize(28, 24)
         refresh_button.setToolTip("Refresh")
-        refresh_button.clicked.connect(self.refresh_requested)
+        refresh_button.clicked.connect(self.refresh_requested.emit)
         button_layout.addWidget(refresh_button)
         
         button_layout.addStretch()
@@ -471,93 +777,7 @@ class ControlPopup(QWidget):
         self.setLayout(outer_layout)
         
         # Dark theme styling
-        self.setStyleSheet("""
-            #container {
-                background-color: #1e1e1e;
-                border: 1px solid #3c3c3c;
-                border-radius: 8px;
-            }
-            
-            #title {
-                color: #e0e0e0;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 2px;
-            }
-            
-            #separator {
-                background-color: #3c3c3c;
-                max-height: 1px;
-            }
-            
-            QLabel {
-                color: #e0e0e0;
-            }
-            
-            #no_lights {
-                color: #808080;
-                padding: 15px;
-            }
-            
-            QCheckBox {
-                color: #e0e0e0;
-                spacing: 5px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1px solid #606060;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #0d7377;
-                border-color: #14b8a6;
-            }
-            
-            QSlider::groove:horizontal {
-                height: 4px;
-                background: #3c3c3c;
-                border-radius: 2px;
-            }
-            
-            QSlider::handle:horizontal {
-                width: 12px;
-                height: 12px;
-                background: #14b8a6;
-                border-radius: 6px;
-                margin: -4px 0;
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: #0d7377;
-                border-radius: 2px;
-            }
-            
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                padding: 2px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #3c3c3c;
-                border-color: #4c4c4c;
-            }
-            
-            QPushButton:pressed {
-                background-color: #252525;
-            }
-            
-            #refresh_btn, #close_btn {
-                font-size: 14px;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
         
         # Set fixed size to prevent stretching
         self.setFixedWidth(280)
@@ -570,7 +790,7 @@ class ControlPopup(QWidget):
             if len(self.light_widgets) == 0:
                 self.no_lights_label.setVisible(False)
                 
-            widget = LightControlWidget(light)
+            widget = LightControlWidget(light, self.api)
             self.light_widgets[light.serial_number] = widget
             
             # Add separator between lights
@@ -587,6 +807,7 @@ class ControlPopup(QWidget):
         """Remove a light control widget"""
         if serial in self.light_widgets:
             widget = self.light_widgets[serial]
+            widget.shutdown()
             self.lights_layout.removeWidget(widget)
             widget.deleteLater()
             del self.light_widgets[serial]
@@ -595,6 +816,25 @@ class ControlPopup(QWidget):
             if len(self.light_widgets) == 0:
                 self.no_lights_label.setVisible(True)
                 
+    @pyqtSlot(str, bool, int)
+    def on_api_result(self, serial, is_on, brightness):
+        """Forward an API result to the widget of that light"""
+        widget = self.light_widgets.get(serial)
+        if widget:
+            widget.on_api_result(serial, is_on, brightness)
+            
+    @pyqtSlot(str, int)
+    def on_brightness_done(self, serial, generation):
+        """Forward a finished brightness request to the widget of that light"""
+        widget = self.light_widgets.get(serial)
+        if widget:
+            widget.on_brightness_applied(generation)
+            
+    def shutdown(self):
+        """Stop all light widgets before the API pool goes away"""
+        for widget in self.light_widgets.values():
+            widget.shutdown()
+            
     def update_light(self, light: KeyLight):
         """Update a light control widget"""
         if light.serial_number in self.light_widgets:
@@ -608,11 +848,13 @@ class ControlPopup(QWidget):
         # Update all light states when showing
         for widget in self.light_widgets.values():
             widget.update_state()
+        self.popup_shown.emit()
+        
+    def hideEvent(self, event):
+        """Handle hide event"""
+        super().hideEvent(event)
+        self.popup_hidden.emit()
             
-    def refresh_requested(self):
-        """Signal that refresh was requested"""
-        pass
-    
     def mousePressEvent(self, event):
         """Allow dragging the window"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -627,15 +869,24 @@ class ControlPopup(QWidget):
 class WayKeyLightTray(QSystemTrayIcon):
     """System tray application for controlling Key Lights"""
     
+    # Poll slowly while nobody is looking, quickly while the popup is open
+    IDLE_POLL_INTERVAL = 30000
+    ACTIVE_POLL_INTERVAL = 2000
+    # Seconds after a poll during which opening the popup doesn't poll again
+    POLL_STALE_AFTER = 1.0
+    
     def __init__(self, app: QApplication):
         super().__init__()
         self.app = app
         self.lights: Dict[str, KeyLight] = {}
-        self.update_workers = []
+        self.last_poll = 0.0
+        
+        # Shared worker pool for all light API calls
+        self.api = APIWorker()
+        self.api.statuses_ready.connect(self.on_status_update)
         
-        # Create popup window
-        self.popup = ControlPopup()
-        self.popup.refresh_requested = self.refresh_lights
+        # Popup window is built on first show
+        self.popup: Optional[ControlPopup] = None
         
         # Setup discovery
         self.discovery = KeyLightDiscovery()
@@ -649,10 +900,10 @@ class WayKeyLightTray(QSystemTrayIcon):
         # Connect left-click to show popup
         self.activated.connect(self.on_tray_activated)
         
-        # Setup update timer with longer interval
+        # Setup update timer, sped up while the popup is visible
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_light_states)
-        self.update_timer.start(10000)  # Update every 10 seconds instead of 5
+        self.update_timer.start(self.IDLE_POLL_INTERVAL)
         
         # Start discovery
         self.discovery.start()
@@ -698,8 +949,20 @@ class WayKeyLightTray(QSystemTrayIcon):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:  # Left click
             self.show_popup()
         
+    def _ensure_popup(self) -> ControlPopup:
+        """Create the popup window and add already discovered lights"""
+        if self.popup is None:
+            self.popup = ControlPopup(self.api)
+            self.popup.refresh_requested.connect(self.refresh_lights)
+            self.popup.popup_shown.connect(self.on_popup_shown)
+            self.popup.popup_hidden.connect(self.on_popup_hidden)
+            for light in self.lights.values():
+                self.popup.add_light(light)
+        return self.popup
+        
     def show_popup(self):
         """Show the control popup"""
+        self._ensure_popup()
         if self.popup.isVisible():
             self.popup.hide()
         else:
@@ -707,37 +970,48 @@ class WayKeyLightTray(QSystemTrayIcon):
             self.popup.raise_()
             self.popup.activateWindow()
             
+    def on_popup_shown(self):
+        """Poll frequently and refresh immediately while the popup is open"""
+        self.update_timer.setInterval(self.ACTIVE_POLL_INTERVAL)
+        if time.monotonic() - self.last_poll > self.POLL_STALE_AFTER:
+            self.update_light_states()
+        
+    def on_popup_hidden(self):
+        """Fall back to the idle poll interval"""
+        self.update_timer.setInterval(self.IDLE_POLL_INTERVAL)
+            
     def on_light_discovered(self, light: KeyLight):
         """Handle new light discovery"""
         self.lights[light.serial_number] = light
-        self.popup.add_light(light)
+        if self.popup:
+            self.popup.add_light(light)
         
     def on_light_removed(self, serial: str):
         """Handle light removal"""
         if serial in self.lights:
             del self.lights[serial]
-            self.popup.remove_light(serial)
+            if self.popup:
+                self.popup.remove_light(serial)
             
     def update_light_states(self):
         """Periodically update light states in background"""
-        for light in self.lights.values():
-            worker = APIWorker(light, 'status')
-            worker.result_ready.connect(self.on_status_update)
-            worker.start()
-            self.update_workers.append(worker)
+        if not self.lights:
+            return
+        self.last_poll = time.monotonic()
+        self.api.poll(list(self.lights.values()))
             
-    @pyqtSlot(str, bool, int)
-    def on_status_update(self, serial, is_on, brightness):
-        """Handle status update from worker"""
-        if serial in self.lights:
-            light = self.lights[serial]
-            if light.is_on != is_on or light.brightness != brightness:
+    @pyqtSlot(list)
+    def on_status_update(self, statuses):
+        """Handle a batch of status updates from worker"""
+        # The worker already updated the shared KeyLight objects, so
+        # comparing against them can't detect changes; refresh every widget
+        for serial, is_on, brightness in statuses:
+            if serial in self.lights:
+                light = self.lights[serial]
                 light.is_on = is_on
                 light.brightness = brightness
-                self.popup.update_light(light)
-        
-        # Clean up finished workers
-        self.update_workers = [w for w in self.update_workers if w.isRunning()]
+                if self.popup:
+                    self.popup.update_light(light)
                 
     def refresh_lights(self):
         """Manually refresh light discovery"""
@@ -746,8 +1020,11 @@ class WayKeyLightTray(QSystemTrayIcon):
         
     def quit_application(self):
         """Quit the application"""
-        self.discovery.stop()
-        self.popup.close()
+        self.discovery.shutdown()
+        if self.popup:
+            self.popup.shutdown()
+            self.popup.close()
+        self.api.shutdown()
         self.app.quit()
 
 